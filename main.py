@@ -19,8 +19,15 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-try:
-    from book_recommender.main import main
+if __name__ == "__main__":
+    # Import lazily so that importing this module does not load the UI,
+    # embedding model and vector store stack
+    try:
+        from book_recommender.main import main
+    except ImportError as e:
+        print(f"Error importing main application: {e}")
+        print("Please install dependencies: pip install -r requirements.txt")
+        sys.exit(1)
 
     warnings.warn(
         "Using legacy main.py. Please use 'python src/book_recommender/main.py' or install the package.",
@@ -28,10 +35,4 @@ try:
         stacklevel=2
     )
 
-    if __name__ == "__main__":
-        main()
-
-except ImportError as e:
-    print(f"Error importing main application: {e}")
-    print("Please install dependencies: pip install -r requirements.txt")
-    sys.exit(1)
+    main()
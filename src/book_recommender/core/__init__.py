@@ -2,7 +2,7 @@
 
 from .config import config, Config
 from .models import Book, RecommendationRequest, BookRecommendation, RecommendationResponse
-from .recommender import BookRecommender
+from .recommender import BookRecommender, get_recommender
 
 __all__ = [
     "config",
@@ -12,4 +12,5 @@ __all__ = [
     "BookRecommendation",
     "RecommendationResponse",
     "BookRecommender",
+    "get_recommender",
 ]
@@ -0,0 +1,176 @@
+"""Recommendation response caching for the Book Recommender System."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Sequence, Tuple
+
+import numpy as np
+
+# (scope, normalized query)
+_Key = Tuple[Hashable, str]
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache with per-entry expiry and similarity lookup.
+
+    Entries are stored under an exact key made of a scope (the request
+    filters) and a normalized query. When similarity lookup is enabled,
+    entries can also carry the query embedding, so a near-duplicate query in
+    the same scope can be answered from the cache when its embedding is close
+    enough to a cached one.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 512,
+        ttl_seconds: Optional[float] = 3600.0,
+        similarity_threshold: Optional[float] = None
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries; 0 disables caching.
+            ttl_seconds: Entry lifetime in seconds; None keeps entries until evicted.
+            similarity_threshold: Minimum inner product between unit-length query
+                embeddings for a similarity hit; None disables similarity lookup.
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+        # (scope, normalized query) -> (stored_at, value)
+        self._entries: "OrderedDict[_Key, Tuple[float, Any]]" = OrderedDict()
+        # scope -> {(scope, normalized query) -> query embedding}
+        self._embeddings: Dict[Hashable, Dict[_Key, np.ndarray]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Get the number of cached entries, including expired ones."""
+        return len(self._entries)
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """Normalize a query for exact-match lookups."""
+        return " ".join(query.split()).casefold()
+
+    def get(self, scope: Hashable, query: str) -> Optional[Any]:
+        """
+        Look up an entry by exact (normalized) query.
+
+        Args:
+            scope: Hashable request filters the entry was stored under
+            query: Raw user query
+
+        Returns:
+            The cached value, or None on a miss.
+        """
+        key = (scope, self.normalize_query(query))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self._is_expired(entry[0]):
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def get_similar(self, scope: Hashable, embedding: Sequence[float]) -> Optional[Any]:
+        """
+        Look up the entry whose query embedding is most similar to ``embedding``.
+
+        Args:
+            scope: Hashable request filters the entry was stored under
+            embedding: Unit-length query embedding
+
+        Returns:
+            The cached value if the best match reaches the similarity
+            threshold, otherwise None.
+        """
+        if self.similarity_threshold is None:
+            return None
+
+        query_embedding = np.asarray(embedding, dtype=np.float32)
+        with self._lock:
+            scoped = self._embeddings.get(scope)
+            if not scoped:
+                return None
+
+            keys = list(scoped)
+            similarities = np.stack(list(scoped.values())) @ query_embedding
+            while True:
+                best = int(np.argmax(similarities))
+                if similarities[best] < self.similarity_threshold:
+                    return None
+
+                stored_at, value = self._entries[keys[best]]
+                if not self._is_expired(stored_at):
+                    self._entries.move_to_end(keys[best])
+                    return value
+
+                # Drop the expired match and try the next best one
+                self._remove(keys[best])
+                similarities[best] = -np.inf
+
+    def put(
+        self,
+        scope: Hashable,
+        query: str,
+        value: Any,
+        embedding: Optional[Sequence[float]] = None
+    ) -> None:
+        """
+        Store an entry, evicting the least recently used one when full.
+
+        Args:
+            scope: Hashable request filters
+            query: Raw user query
+            value: Value to cache
+            embedding: Optional unit-length query embedding for similarity lookups
+        """
+        if self.max_size <= 0:
+            return
+
+        key = (scope, self.normalize_query(query))
+
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+
+            if embedding is not None and self.similarity_threshold is not None:
+                self._embeddings.setdefault(scope, {})[key] = np.asarray(
+                    embedding, dtype=np.float32
+                )
+            else:
+                self._drop_embedding(key)
+
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._embeddings.clear()
+
+    def _remove(self, key: _Key) -> None:
+        """Remove an entry and its embedding; the caller holds the lock."""
+        del self._entries[key]
+        self._drop_embedding(key)
+
+    def _drop_embedding(self, key: _Key) -> None:
+        """Forget the embedding stored for ``key``; the caller holds the lock."""
+        scoped = self._embeddings.get(key[0])
+        if scoped is not None:
+            scoped.pop(key, None)
+            if not scoped:
+                del self._embeddings[key[0]]
+
+    def _is_expired(self, stored_at: float) -> bool:
+        """Check whether an entry stored at ``stored_at`` has expired."""
+        return (
+            self.ttl_seconds is not None
+            and time.monotonic() - stored_at >= self.ttl_seconds
+        )
@@ -2,8 +2,9 @@
 
 import os
 import yaml
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 from pydantic import BaseModel, Field
 
 
@@ -14,6 +15,9 @@ class AppConfig(BaseModel):
     debug: bool = False
     host: str = "0.0.0.0"
     port: int = 7860
+    concurrency_limit: int = 40
+    queue_max_size: int = 64
+    max_batch_size: int = 16
 
 
 class DataConfig(BaseModel):
@@ -21,20 +25,48 @@ class DataConfig(BaseModel):
     books_file: str = "data/books_with_emotions.csv"
     descriptions_file: str = "data/tagged_description.txt"
     missing_cover_image: str = "assets/missing_cover.png"
+    vector_store_cache_dir: str = ".chroma_cache"
 
 
 class ModelConfig(BaseModel):
     """Model configuration."""
     embedding_model: str = "all-MiniLM-L6-v2"
+    embedding_backend: str = "torch"
+    embedding_model_file: Optional[str] = None
+    embedding_batch_size: int = 32
+    query_cache_size: int = 1024
     chunk_size: int = 0
     chunk_overlap: int = 0
     separator: str = "\n"
 
 
 class SearchConfig(BaseModel):
-    """Search configuration."""
+    """
+    Search configuration.
+
+    The HNSW parameters trade index size and build time for recall: a larger
+    ``hnsw_m`` (graph degree) and ``hnsw_ef_construction`` give a better
+    connected graph at the cost of memory and a slower build, while
+    ``hnsw_ef_search`` widens the candidate list explored per query, raising
+    recall at the cost of query latency. Embeddings are L2-normalized, so the
+    inner-product space ranks exactly like cosine without normalizing inside
+    the distance kernel.
+
+    Responses are cached per (query, category, tone, top_k) and reused for
+    exact (case- and whitespace-insensitive) repeats. Setting
+    ``semantic_cache_threshold`` (e.g. 0.97) also lets a new query whose
+    embedding has at least that cosine similarity to a cached query with the
+    same filters reuse its response; it is off by default.
+    """
     initial_top_k: int = 50
     final_top_k: int = 12
+    hnsw_space: str = "ip"
+    hnsw_m: int = 32
+    hnsw_ef_construction: int = 200
+    hnsw_ef_search: int = 64
+    result_cache_size: int = 512
+    result_cache_ttl_seconds: Optional[float] = 3600.0
+    semantic_cache_threshold: Optional[float] = None
 
 
 class UIConfig(BaseModel):
@@ -78,7 +110,26 @@ class Config(BaseModel):
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
 
 
-def load_config(config_path: Optional[str] = None) -> Config:
+@lru_cache(maxsize=8)
+def _read_config_file(config_path: str, mtime_ns: int) -> Any:
+    """
+    Parse a YAML configuration file.
+
+    Results are cached per file and modification time, so repeated loads of an
+    unchanged file skip the YAML parse while an edited file is read again.
+
+    Args:
+        config_path: Resolved path to the configuration file.
+        mtime_ns: Modification time of the file, used as part of the cache key.
+
+    Returns:
+        Parsed YAML content.
+    """
+    with open(config_path, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f)
+
+
+def load_config(config_path: Optional[Union[str, Path]] = None) -> Config:
     """
     Load configuration from YAML file.
 
@@ -100,8 +151,10 @@ def load_config(config_path: Optional[str] = None) -> Config:
         return Config()
 
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config_data = yaml.safe_load(f)
+        config_path = config_path.resolve()
+        config_data = _read_config_file(
+            str(config_path), config_path.stat().st_mtime_ns
+        )
 
         return Config(**config_data)
     except Exception as e:
@@ -0,0 +1,124 @@
+"""Embedding model wrappers for the Book Recommender System."""
+
+import threading
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.embeddings import Embeddings
+
+# Loaded sentence-transformers models, shared by every embeddings instance
+_models: Dict[Tuple[str, str, Optional[str]], Any] = {}
+_models_lock = threading.Lock()
+
+
+def _load_model(model_name: str, backend: str, model_file: Optional[str]) -> Any:
+    """
+    Get a shared sentence-transformers model, loading it on first use.
+
+    Args:
+        model_name: Name or path of the sentence-transformers model.
+        backend: Inference backend, "torch", "onnx" or "openvino".
+        model_file: Backend model file to load from the model repository.
+
+    Returns:
+        Loaded SentenceTransformer instance.
+    """
+    key = (model_name, backend, model_file)
+    model = _models.get(key)
+    if model is None:
+        with _models_lock:
+            model = _models.get(key)
+            if model is None:
+                from sentence_transformers import SentenceTransformer
+
+                model_args: Dict[str, Any] = {}
+                if backend != "torch":
+                    # Non-torch backends need sentence-transformers >= 3.2
+                    model_args["backend"] = backend
+                if model_file:
+                    model_args["model_kwargs"] = {"file_name": model_file}
+
+                model = SentenceTransformer(model_name, **model_args)
+                _models[key] = model
+    return model
+
+
+class SentenceTransformerEmbeddings(Embeddings):
+    """LangChain embeddings backed directly by a sentence-transformers model."""
+
+    def __init__(
+        self,
+        model_name: str,
+        batch_size: int = 32,
+        normalize: bool = True,
+        backend: str = "torch",
+        model_file: Optional[str] = None
+    ):
+        """
+        Initialize the embedding model.
+
+        Args:
+            model_name: Name or path of the sentence-transformers model.
+            batch_size: Number of texts encoded per forward pass.
+            normalize: Whether to L2-normalize the returned vectors.
+            backend: Inference backend, "torch", "onnx" or "openvino".
+            model_file: Backend model file to load from the model repository,
+                e.g. a quantized "onnx/model_qint8_avx512_vnni.onnx".
+        """
+        self.client = _load_model(model_name, backend, model_file)
+        self.batch_size = batch_size
+        self.normalize = normalize
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed a list of documents."""
+        embeddings = self.client.encode(
+            texts,
+            batch_size=self.batch_size,
+            normalize_embeddings=self.normalize,
+            convert_to_numpy=True
+        )
+        vectors: List[List[float]] = embeddings.tolist()
+        return vectors
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a single query."""
+        return self.embed_documents([text])[0]
+
+
+class CachedEmbeddings(Embeddings):
+    """Embeddings wrapper that memoizes query embeddings."""
+
+    def __init__(self, embeddings: Embeddings, cache_size: int = 1024):
+        """
+        Initialize the cached embeddings.
+
+        Args:
+            embeddings: Underlying embedding model.
+            cache_size: Maximum number of query embeddings kept in memory.
+        """
+        self.embeddings = embeddings
+        self._embed_query_cached = lru_cache(maxsize=cache_size)(self._embed_query)
+
+    def _embed_query(self, text: str) -> Tuple[float, ...]:
+        """Embed a single normalized query."""
+        return tuple(self.embeddings.embed_query(text))
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed a list of documents."""
+        return self.embeddings.embed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a query, reusing the cached vector for repeated queries."""
+        return list(self._embed_query_cached(text.strip()))
+
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed several queries in a single batched forward pass.
+
+        Args:
+            texts: Queries to embed.
+
+        Returns:
+            One embedding per query, in input order.
+        """
+        return self.embeddings.embed_documents([text.strip() for text in texts])
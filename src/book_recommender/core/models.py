@@ -10,7 +10,6 @@ class Book(BaseModel):
     title: str
     authors: str
     description: str
-    thumbnail: Optional[str] = None
     large_thumbnail: Optional[str] = None
     simplified_categories: str
     joy: float = 0.0
@@ -1,20 +1,44 @@
 """Core recommendation engine for the Book Recommender System."""
 
-import pandas as pd
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import threading
 import numpy as np
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
 from loguru import logger
 
-from langchain_community.document_loaders import TextLoader
-from langchain_text_splitters import CharacterTextSplitter
-from langchain.embeddings import HuggingFaceEmbeddings
-from langchain_chroma import Chroma
-
+from .cache import ResponseCache
 from .config import config
 from .models import Book, RecommendationRequest, BookRecommendation, RecommendationResponse
 from ..utils.exceptions import DataLoadError, ModelInitError, RecommendationError
 
+# pandas, LangChain and the embedding stack are imported on first use so that
+# importing the package (CLI --help/--version, tests) stays fast
+if TYPE_CHECKING:
+    import pandas as pd
+    from langchain_chroma import Chroma
+
+    from .embeddings import CachedEmbeddings
+
+# Catalog columns read from the books CSV, besides the emotion score columns
+_BOOK_COLUMNS = [
+    "isbn13", "title", "authors", "description", "thumbnail", "simplified_categories"
+]
+_BOOK_DTYPES = {"isbn13": np.int64}
+
+# Tagged descriptions start with the book's ISBN, optionally quoted
+_BOOK_ID_PATTERN = re.compile(r'"?\s*(\d+)')
+
+# Process-wide recommenders shared by every UI instance, per resolved data dir
+_recommenders: Dict[Path, BookRecommender] = {}
+_recommenders_lock = threading.Lock()
+
 
 class BookRecommender:
     """Main recommendation engine for books."""
@@ -29,7 +53,18 @@ class BookRecommender:
         self.data_dir = data_dir or Path(".")
         self.books_df: Optional[pd.DataFrame] = None
         self.vector_store: Optional[Chroma] = None
-        self.embedding_model: Optional[HuggingFaceEmbeddings] = None
+        self._collection: Optional[Any] = None
+        self.embedding_model: Optional[CachedEmbeddings] = None
+        self._isbn_to_row: Dict[int, int] = {}
+        self._category_codes: Optional[np.ndarray] = None
+        self._category_to_code: Dict[str, int] = {}
+        self._emotions: Optional[np.ndarray] = None
+        self._tone_to_emotion_index: Dict[str, int] = {}
+        self._response_cache = ResponseCache(
+            max_size=config.search.result_cache_size,
+            ttl_seconds=config.search.result_cache_ttl_seconds,
+            similarity_threshold=config.search.semantic_cache_threshold
+        )
         self._is_initialized = False
 
     def initialize(self) -> None:
@@ -47,21 +82,66 @@ class BookRecommender:
 
     def _load_data(self) -> None:
         """Load books data from CSV file."""
+        import pandas as pd
+
         books_file = self.data_dir / config.data.books_file
 
         if not books_file.exists():
             raise DataLoadError(f"Books file not found: {books_file}")
 
         try:
-            self.books_df = pd.read_csv(books_file)
+            # Only load the columns the recommender uses; emotion columns come
+            # from the tone mapping and are skipped if the CSV lacks them
+            header = pd.read_csv(books_file, nrows=0).columns
+            emotion_columns = [
+                column for column in config.emotions.emotion_mapping.values()
+                if column in header
+            ]
+            self.books_df = pd.read_csv(
+                books_file,
+                engine='pyarrow',
+                dtype_backend='pyarrow',
+                usecols=_BOOK_COLUMNS + emotion_columns,
+                dtype={
+                    **_BOOK_DTYPES,
+                    **{column: np.float32 for column in emotion_columns}
+                }
+            )
+
+            # Index rows by ISBN so search hits resolve without scanning the catalog
+            self._isbn_to_row = dict(zip(
+                self.books_df['isbn13'].tolist(),
+                range(len(self.books_df))
+            ))
+
+            # Categories are compared per query, so store them as integer codes
+            self.books_df['simplified_categories'] = (
+                self.books_df['simplified_categories'].astype('category')
+            )
+            categories = self.books_df['simplified_categories'].cat
+            self._category_codes = categories.codes.to_numpy()
+            self._category_to_code = {
+                category: code for code, category in enumerate(categories.categories)
+            }
+
+            # Keep emotion scores as one contiguous float32 (rows x emotions) array
+            self._emotions = self.books_df[emotion_columns].to_numpy(
+                dtype=np.float32, copy=True
+            )
+            # Resolve each tone straight to its column in the emotions array
+            self._tone_to_emotion_index = {
+                tone: emotion_columns.index(column)
+                for tone, column in config.emotions.emotion_mapping.items()
+                if column in emotion_columns
+            }
 
             # Process thumbnail URLs
-            self.books_df['large_thumbnail'] = self.books_df['thumbnail'] + "&fife=w800"
-            self.books_df['large_thumbnail'] = np.where(
-                self.books_df['large_thumbnail'].isna(),
-                str(self.data_dir / config.data.missing_cover_image),
-                self.books_df['large_thumbnail']
+            thumbnail = self.books_df['thumbnail']
+            self.books_df['large_thumbnail'] = (thumbnail + "&fife=w800").where(
+                thumbnail.notna(),
+                str(self.data_dir / config.data.missing_cover_image)
             )
+            del self.books_df['thumbnail']
 
             logger.info(f"Loaded {len(self.books_df)} books from {books_file}")
 
@@ -70,9 +150,17 @@ class BookRecommender:
 
     def _setup_embeddings(self) -> None:
         """Setup embedding model."""
+        from .embeddings import CachedEmbeddings, SentenceTransformerEmbeddings
+
         try:
-            self.embedding_model = HuggingFaceEmbeddings(
-                model_name=config.model.embedding_model
+            self.embedding_model = CachedEmbeddings(
+                SentenceTransformerEmbeddings(
+                    model_name=config.model.embedding_model,
+                    batch_size=config.model.embedding_batch_size,
+                    backend=config.model.embedding_backend,
+                    model_file=config.model.embedding_model_file
+                ),
+                cache_size=config.model.query_cache_size
             )
             logger.info(f"Loaded embedding model: {config.model.embedding_model}")
         except Exception as e:
@@ -80,12 +168,28 @@ class BookRecommender:
 
     def _setup_vector_store(self) -> None:
         """Setup vector store from descriptions."""
+        from langchain_chroma import Chroma
+        from langchain_community.document_loaders import TextLoader
+        from langchain_text_splitters import CharacterTextSplitter
+
         descriptions_file = self.data_dir / config.data.descriptions_file
 
         if not descriptions_file.exists():
             raise DataLoadError(f"Descriptions file not found: {descriptions_file}")
 
         try:
+            persist_dir = (
+                self.data_dir
+                / config.data.vector_store_cache_dir
+                / self._vector_store_cache_key(descriptions_file)
+            )
+
+            # Reuse the persisted index when the descriptions and model are unchanged
+            if persist_dir.exists():
+                self._open_vector_store(persist_dir)
+                logger.info(f"Loaded cached vector store from {persist_dir}")
+                return
+
             # Load and split documents
             raw_document = TextLoader(str(descriptions_file), encoding='utf-8').load()
             text_splitter = CharacterTextSplitter(
@@ -95,19 +199,83 @@ class BookRecommender:
             )
             documents = text_splitter.split_documents(raw_document)
 
-            # Create vector store
-            self.vector_store = Chroma.from_documents(documents, self.embedding_model)
-            logger.info(f"Created vector store with {len(documents)} documents")
+            # Chroma creates its directory before embedding anything, so build
+            # into a scratch directory and only move it into place once every
+            # document is in; an interrupted build never looks like a valid cache
+            persist_dir.parent.mkdir(parents=True, exist_ok=True)
+            build_dir = Path(tempfile.mkdtemp(
+                prefix=f".{persist_dir.name}-", dir=persist_dir.parent
+            ))
+            try:
+                Chroma.from_documents(
+                    documents,
+                    self.embedding_model,
+                    persist_directory=str(build_dir),
+                    collection_metadata=self._collection_metadata()
+                )
+                os.replace(build_dir, persist_dir)
+            except BaseException:
+                shutil.rmtree(build_dir, ignore_errors=True)
+                # Another process may have finished the same build first
+                if not persist_dir.exists():
+                    raise
+
+            self._open_vector_store(persist_dir)
+            logger.info(
+                f"Created vector store with {len(documents)} documents "
+                f"in {persist_dir}"
+            )
 
         except Exception as e:
             raise ModelInitError(f"Failed to setup vector store: {e}")
 
+    def _open_vector_store(self, persist_dir: Path) -> None:
+        """Open the persisted vector store in ``persist_dir``."""
+        from langchain_chroma import Chroma
+
+        self.vector_store = Chroma(
+            persist_directory=str(persist_dir),
+            embedding_function=self.embedding_model
+        )
+        self._collection = self.vector_store._collection
+
+    def _vector_store_cache_key(self, descriptions_file: Path) -> str:
+        """
+        Build the cache key for a persisted vector store.
+
+        Args:
+            descriptions_file: Path to the tagged descriptions file
+
+        Returns:
+            Short hex digest of the descriptions content, embedding model
+            settings and HNSW index settings.
+        """
+        digest = hashlib.sha256(descriptions_file.read_bytes())
+        for model_setting in (
+            config.model.embedding_model,
+            config.model.embedding_backend,
+            config.model.embedding_model_file or "",
+        ):
+            digest.update(model_setting.encode("utf-8"))
+        index_settings = sorted(self._collection_metadata().items())
+        digest.update(repr(index_settings).encode("utf-8"))
+        return digest.hexdigest()[:16]
+
+    def _collection_metadata(self) -> Dict[str, Any]:
+        """Get the HNSW index settings for the Chroma collection."""
+        return {
+            "hnsw:space": config.search.hnsw_space,
+            "hnsw:M": config.search.hnsw_m,
+            "hnsw:construction_ef": config.search.hnsw_ef_construction,
+            "hnsw:search_ef": config.search.hnsw_ef_search,
+        }
+
     def get_categories(self) -> List[str]:
         """Get available book categories."""
         if not self._is_initialized or self.books_df is None:
             raise RecommendationError("Recommender not initialized")
 
-        categories = ["All"] + sorted(self.books_df['simplified_categories'].unique())
+        categories = ["All"] + sorted(self._category_to_code)
         return categories
 
     def get_tones(self) -> List[str]:
@@ -124,10 +292,25 @@ class BookRecommender:
         Returns:
             RecommendationResponse with recommended books.
         """
-        if not self._is_initialized:
+        if not self._is_initialized or self.embedding_model is None:
             raise RecommendationError("Recommender not initialized")
 
         try:
+            scope = self._cache_scope(request)
+            cached: Optional[RecommendationResponse] = self._response_cache.get(
+                scope, request.query
+            )
+            if cached is not None:
+                return cached.model_copy(update={"query": request.query})
+
+            # Reuse the response of a near-identical earlier query
+            query_embedding = self.embedding_model.embed_query(request.query)
+            similar: Optional[RecommendationResponse] = (
+                self._response_cache.get_similar(scope, query_embedding)
+            )
+            if similar is not None:
+                return similar.model_copy(update={"query": request.query})
+
             # Get semantic recommendations
             recommendations = self._get_semantic_recommendations(
                 query=request.query,
@@ -137,33 +320,161 @@ class BookRecommender:
                 final_top_k=request.top_k
             )
 
-            # Convert to response format
-            book_recommendations = []
-            for _, row in recommendations.iterrows():
-                book = Book(**row.to_dict())
+            response = self._build_response(request, recommendations)
+            self._response_cache.put(scope, request.query, response, query_embedding)
+            return response
+
+        except Exception as e:
+            logger.error("Recommendation failed: {}", e)
+            raise RecommendationError(f"Failed to get recommendations: {e}")
+
+    def recommend_batch(
+        self,
+        requests: List[RecommendationRequest]
+    ) -> List[Union[RecommendationResponse, RecommendationError]]:
+        """
+        Get book recommendations for several requests at once.
+
+        Cached requests are answered directly; the remaining queries are
+        embedded in one batched forward pass and searched with a single
+        vector store query. A request whose results cannot be built gets a
+        RecommendationError in its slot instead of failing the whole batch.
 
-                # Create caption
-                caption = self._create_book_caption(book)
+        Args:
+            requests: Recommendation requests with queries, filters, etc.
+
+        Returns:
+            One RecommendationResponse, or the RecommendationError it failed
+            with, per request, in input order.
 
-                book_rec = BookRecommendation(
-                    book=book,
-                    thumbnail_url=row['large_thumbnail'],
-                    caption=caption
+        Raises:
+            RecommendationError: If the shared embedding or search step fails.
+        """
+        if not self._is_initialized or self.embedding_model is None:
+            raise RecommendationError("Recommender not initialized")
+
+        try:
+            # Request index -> response, filled in as requests are answered
+            responses: Dict[
+                int, Union[RecommendationResponse, RecommendationError]
+            ] = {}
+            for i, request in enumerate(requests):
+                cached: Optional[RecommendationResponse] = self._response_cache.get(
+                    self._cache_scope(request), request.query
                 )
-                book_recommendations.append(book_rec)
+                if cached is not None:
+                    responses[i] = cached.model_copy(update={"query": request.query})
 
-            return RecommendationResponse(
-                recommendations=book_recommendations,
-                query=request.query,
-                category=request.category,
-                tone=request.tone,
-                total_found=len(book_recommendations)
+            pending = [i for i in range(len(requests)) if i not in responses]
+            if not pending:
+                return [responses[i] for i in range(len(requests))]
+
+            query_embeddings = self.embedding_model.embed_queries(
+                [requests[i].query for i in pending]
             )
 
+            # Reuse responses of near-identical earlier queries
+            misses = []
+            for i, query_embedding in zip(pending, query_embeddings):
+                request = requests[i]
+                cached = self._response_cache.get_similar(
+                    self._cache_scope(request), query_embedding
+                )
+                if cached is not None:
+                    responses[i] = cached.model_copy(update={"query": request.query})
+                else:
+                    misses.append((i, query_embedding))
+
+            if misses:
+                results = self._query_documents(
+                    [query_embedding for _, query_embedding in misses],
+                    n_results=config.search.initial_top_k
+                )
+                for (i, query_embedding), documents in zip(misses, results):
+                    request = requests[i]
+                    try:
+                        recommendations = self._filter_books(
+                            book_ids=self._parse_book_ids(documents),
+                            category=request.category,
+                            tone=request.tone,
+                            initial_top_k=config.search.initial_top_k,
+                            final_top_k=request.top_k
+                        )
+                        responses[i] = self._build_response(request, recommendations)
+                    except Exception as e:
+                        logger.error(
+                            "Recommendation failed for query '{}': {}", request.query, e
+                        )
+                        responses[i] = RecommendationError(
+                            f"Failed to get recommendations: {e}"
+                        )
+                        continue
+                    self._response_cache.put(
+                        self._cache_scope(request),
+                        request.query,
+                        responses[i],
+                        query_embedding
+                    )
+
+            return [responses[i] for i in range(len(requests))]
+
         except Exception as e:
-            logger.error(f"Recommendation failed: {e}")
+            logger.error("Batch recommendation failed: {}", e)
             raise RecommendationError(f"Failed to get recommendations: {e}")
 
+    def warmup(self) -> None:
+        """
+        Run one throwaway query through the embedding model and vector index.
+
+        This pays their lazy initialization cost up front without touching the
+        response or query embedding caches.
+        """
+        if not self._is_initialized or self.embedding_model is None:
+            raise RecommendationError("Recommender not initialized")
+
+        query_embeddings = self.embedding_model.embed_queries(["warmup"])
+        self._query_documents(query_embeddings, n_results=config.search.initial_top_k)
+
+    def _cache_scope(self, request: RecommendationRequest) -> Tuple[str, str, int]:
+        """Get the filters that must match for a cached response to be reused."""
+        return (request.category, request.tone, request.top_k)
+
+    def _build_response(
+        self,
+        request: RecommendationRequest,
+        recommendations: pd.DataFrame
+    ) -> RecommendationResponse:
+        """
+        Convert recommended rows into a response.
+
+        Args:
+            request: Original recommendation request
+            recommendations: DataFrame with recommended books
+
+        Returns:
+            RecommendationResponse with recommended books.
+        """
+        captions = self._create_captions(recommendations)
+
+        book_recommendations = [
+            BookRecommendation(
+                book=Book(**record),
+                thumbnail_url=record['large_thumbnail'],
+                caption=caption
+            )
+            for record, caption in zip(
+                recommendations.to_dict('records'), captions.tolist()
+            )
+        ]
+
+        return RecommendationResponse(
+            recommendations=book_recommendations,
+            query=request.query,
+            category=request.category,
+            tone=request.tone,
+            total_found=len(book_recommendations)
+        )
+
     def _get_semantic_recommendations(
         self,
         query: str,
@@ -185,68 +496,169 @@ class BookRecommender:
         Returns:
             DataFrame with recommended books.
         """
-        if self.vector_store is None or self.books_df is None:
+        if (
+            self._collection is None
+            or self.embedding_model is None
+            or self.books_df is None
+        ):
             raise RecommendationError("Vector store or books data not available")
 
-        # Get semantic matches
-        search_results = self.vector_store.similarity_search(query, k=initial_top_k)
+        # Get semantic matches for the (cached) query embedding
+        query_embedding = self.embedding_model.embed_query(query)
+        documents = self._query_documents([query_embedding], n_results=initial_top_k)[0]
 
-        # Extract book IDs from search results
-        book_ids = []
-        for result in search_results:
-            try:
-                book_id = int(result.page_content.strip('"').split()[0])
-                book_ids.append(book_id)
-            except (ValueError, IndexError):
-                continue
+        return self._filter_books(
+            book_ids=self._parse_book_ids(documents),
+            category=category,
+            tone=tone,
+            initial_top_k=initial_top_k,
+            final_top_k=final_top_k
+        )
+
+    def _query_documents(
+        self,
+        query_embeddings: List[List[float]],
+        n_results: int
+    ) -> List[List[str]]:
+        """
+        Query the Chroma collection directly with precomputed embeddings.
 
-        # Filter books by IDs
-        filtered_books = self.books_df[
-            self.books_df["isbn13"].isin(book_ids)
-        ].head(initial_top_k).copy()
+        Only the document texts are requested, which skips building LangChain
+        Document objects and fetching metadata or distances.
+
+        Args:
+            query_embeddings: One embedding per query
+            n_results: Number of nearest documents to return per query
+
+        Returns:
+            Matched document texts for each query, ordered by similarity.
+        """
+        if self._collection is None:
+            raise RecommendationError("Vector store not available")
+
+        results = self._collection.query(
+            query_embeddings=query_embeddings,
+            n_results=n_results,
+            include=["documents"]
+        )
+        documents: List[List[str]] = results["documents"]
+        return documents
+
+    def _parse_book_ids(self, contents: Iterable[str]) -> List[int]:
+        """
+        Extract book IDs from tagged descriptions.
+
+        Args:
+            contents: Tagged description texts, each starting with an ISBN
+
+        Returns:
+            List of book IDs in input order.
+        """
+        matches = map(_BOOK_ID_PATTERN.match, contents)
+        return [int(match.group(1)) for match in matches if match]
+
+    def _filter_books(
+        self,
+        book_ids: List[int],
+        category: str = "All",
+        tone: str = "All",
+        initial_top_k: int = 50,
+        final_top_k: int = 12
+    ) -> pd.DataFrame:
+        """
+        Apply category and tone filters to semantically matched books.
+
+        Args:
+            book_ids: Matched book IDs, ordered by similarity
+            category: Category filter
+            tone: Emotional tone filter
+            initial_top_k: Maximum number of matches to consider
+            final_top_k: Final number of results to return
+
+        Returns:
+            DataFrame with recommended books.
+        """
+        if (
+            self.books_df is None
+            or self._category_codes is None
+            or self._emotions is None
+        ):
+            raise RecommendationError("Books data not available")
+
+        # Look up matched books, preserving similarity rank order
+        rows = np.fromiter(
+            (self._isbn_to_row[b] for b in book_ids if b in self._isbn_to_row),
+            dtype=np.intp
+        )[:initial_top_k]
 
         # Apply category filter
         if category != "All":
-            filtered_books = filtered_books[
-                filtered_books['simplified_categories'] == category
-            ]
+            code = self._category_to_code.get(category)
+            if code is None:
+                rows = rows[:0]
+            else:
+                rows = rows[self._category_codes[rows] == code]
 
         # Apply tone filter (sort by emotion)
-        if tone != "All" and tone in config.emotions.emotion_mapping:
-            emotion_column = config.emotions.emotion_mapping[tone]
-            if emotion_column in filtered_books.columns:
-                filtered_books = filtered_books.sort_values(
-                    by=emotion_column, ascending=False
-                )
+        emotion_index = self._tone_to_emotion_index.get(tone)
+        if tone != "All" and emotion_index is not None:
+            # At most initial_top_k candidates, so a full stable sort is cheap
+            # and keeps tied books in similarity order
+            scores = self._emotions[rows, emotion_index]
+            rows = rows[np.argsort(-scores, kind='stable')[:final_top_k]]
 
-        return filtered_books.head(final_top_k)
+        return self.books_df.iloc[rows[:final_top_k]]
 
-    def _create_book_caption(self, book: Book) -> str:
+    def _create_captions(self, books: pd.DataFrame) -> pd.Series:
         """
-        Create a caption for a book recommendation.
+        Create captions for recommended books.
 
         Args:
-            book: Book object
+            books: DataFrame with recommended books
 
         Returns:
-            Formatted caption string.
+            Series of formatted caption strings, aligned with ``books``.
         """
         # Truncate description
-        description = book.description or ""
+        description = books['description'].fillna("")
         max_length = config.ui.description_truncate_length
-        truncated_description = (
-            description[:max_length] + '...'
-            if len(description) > max_length
-            else description
+        truncated_description = description.where(
+            description.str.len() <= max_length,
+            description.str.slice(0, max_length) + '...'
         )
 
-        # Format authors
-        authors_list = book.authors.split(";")
-        if len(authors_list) == 2:
-            authors_str = f"{authors_list[0]} and {authors_list[1]}"
-        elif len(authors_list) > 2:
-            authors_str = f"{', '.join(authors_list[:-1])} and {authors_list[-1]}"
-        else:
-            authors_str = book.authors
+        # Format authors: "A", "A and B", "A, B and C"
+        authors_str = (
+            books['authors']
+            .str.replace(r";([^;]*)$", r" and \1", regex=True)
+            .str.replace(";", ", ", regex=False)
+        )
+
+        return books['title'] + " by " + authors_str + "\n\n" + truncated_description
+
+
+def get_recommender(data_dir: Optional[Path] = None) -> BookRecommender:
+    """
+    Get the shared, initialized recommender for a data directory.
+
+    The data, embedding model and vector index are loaded once per data
+    directory and process; later calls with the same directory reuse them.
+
+    Args:
+        data_dir: Directory containing data files. If None, uses config default.
+
+    Returns:
+        Initialized BookRecommender instance.
+    """
+    key = Path(data_dir or ".").resolve()
+
+    recommender = _recommenders.get(key)
+    if recommender is None:
+        with _recommenders_lock:
+            recommender = _recommenders.get(key)
+            if recommender is None:
+                recommender = BookRecommender(data_dir=data_dir)
+                recommender.initialize()
+                _recommenders[key] = recommender
 
-        return f"{book.title} by {authors_str}\n\n{truncated_description}"
+    return recommender
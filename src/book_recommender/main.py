@@ -4,7 +4,7 @@ from loguru import logger
 from book_recommender.utils.exceptions import BookRecommenderError
 from book_recommender.utils.logging import setup_logging
 from book_recommender.ui import BookRecommenderUI
-from book_recommender.core import config, BookRecommender
+from book_recommender.core import config, get_recommender
 import sys
 from pathlib import Path
 from typing import Optional
@@ -40,8 +40,7 @@ def main(
 
         # Initialize recommender
         data_path = Path(data_dir) if data_dir else Path(".")
-        recommender = BookRecommender(data_dir=data_path)
-        recommender.initialize()
+        recommender = get_recommender(data_dir=data_path)
 
         # Create and launch UI
         ui = BookRecommenderUI(recommender)
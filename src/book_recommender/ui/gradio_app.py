@@ -1,36 +1,97 @@
 """Gradio UI for the Book Recommender System."""
 
-from typing import List, Tuple, Any
-import gradio as gr
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING, List, Optional, Tuple, Any
 from loguru import logger
 
-from ..core import config, BookRecommender, RecommendationRequest
+from ..core import config, BookRecommender, RecommendationRequest, get_recommender
 from ..utils.exceptions import RecommendationError
 
+# Gradio pulls in FastAPI, uvicorn and friends, so it is imported only when
+# the interface is actually built or used
+if TYPE_CHECKING:
+    import gradio as gr
+
+# Custom styles for the Blocks interface
+_CUSTOM_CSS = """
+.header {
+    margin-bottom: 2rem;
+}
+
+.input-textbox {
+    border-radius: 8px;
+}
+
+.dropdown {
+    border-radius: 8px;
+}
+
+.submit-button {
+    margin: 1rem 0;
+    border-radius: 8px;
+    font-weight: bold;
+}
+
+.gallery {
+    margin-top: 1rem;
+    border-radius: 8px;
+}
+
+.footer {
+    margin-top: 2rem;
+    font-size: 0.9em;
+}
+
+#recommendations-gallery .thumbnail {
+    border-radius: 8px;
+    box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+}
+"""
+
 
 class BookRecommenderUI:
     """Gradio UI for the Book Recommender System."""
 
-    def __init__(self, recommender: BookRecommender):
+    def __init__(self, recommender: Optional[BookRecommender] = None):
         """
         Initialize the UI.
 
         Args:
-            recommender: Initialized BookRecommender instance.
+            recommender: Initialized BookRecommender instance. If None, uses
+                the shared recommender from get_recommender().
         """
-        self.recommender = recommender
+        self.recommender = recommender or get_recommender()
         self.interface = None
 
+        # Categories and tones are fixed for the recommender's lifetime
+        self._categories = tuple(self.recommender.get_categories())
+        self._tones = tuple(self.recommender.get_tones())
+
+        # Warm the embedding model and vector index so the first user query
+        # does not pay their lazy initialization cost
+        threading.Thread(
+            target=self._warmup, name="recommender-warmup", daemon=True
+        ).start()
+
+    def _warmup(self) -> None:
+        """Warm up the recommender's models and indexes."""
+        try:
+            self.recommender.warmup()
+            logger.debug("Recommender warmup finished")
+        except Exception as e:
+            logger.warning("Recommender warmup failed: {}", e)
+
     def create_interface(self) -> gr.Blocks:
         """Create and return the Gradio interface."""
-        # Get available options
-        categories = self.recommender.get_categories()
-        tones = self.recommender.get_tones()
+        import gradio as gr
 
         with gr.Blocks(
             theme=gr.themes.Glass(),
             title=config.app.name,
-            css=self._get_custom_css()
+            css=_CUSTOM_CSS
         ) as interface:
 
             # Header
@@ -56,13 +117,13 @@ class BookRecommenderUI:
                 with gr.Column(scale=1):
                     category = gr.Dropdown(
                         label="Category",
-                        choices=categories,
+                        choices=self._categories,
                         value="All",
                         elem_classes="dropdown"
                     )
                     tone = gr.Dropdown(
                         label="Emotional Tone",
-                        choices=tones,
+                        choices=self._tones,
                         value="All",
                         elem_classes="dropdown"
                     )
@@ -75,13 +136,6 @@ class BookRecommenderUI:
                 elem_classes="submit-button"
             )
 
-            # Loading indicator
-            loading_msg = gr.Text(
-                value="",
-                visible=False,
-                elem_classes="loading-text"
-            )
-
             # Output gallery
             output = gr.Gallery(
                 label="Recommended Books",
@@ -102,124 +156,96 @@ class BookRecommenderUI:
                 elem_classes="footer"
             )
 
-            # Event handlers
+            # Event handlers; Gradio's progress overlay on the gallery serves
+            # as the loading indicator
             submit_button.click(
-                fn=self._show_loading,
-                inputs=[],
-                outputs=[loading_msg]
-            ).then(
                 fn=self._get_recommendations,
                 inputs=[query, category, tone],
-                outputs=[output]
-            ).then(
-                fn=self._hide_loading,
-                inputs=[],
-                outputs=[loading_msg]
+                outputs=[output],
+                batch=True,
+                max_batch_size=config.app.max_batch_size,
+                show_progress="full"
             )
 
+        # Handlers are async, so concurrent requests share the event loop and
+        # only the blocking recommender call occupies a worker thread
+        interface.queue(
+            default_concurrency_limit=config.app.concurrency_limit,
+            max_size=config.app.queue_max_size
+        )
+
         self.interface = interface
         return interface
 
-    def _get_recommendations(
+    async def _get_recommendations(
         self,
-        query: str,
-        category: str,
-        tone: str
-    ) -> List[Tuple[str, str]]:
+        queries: List[str],
+        categories: List[str],
+        tones: List[str]
+    ) -> List[List[List[Tuple[str, str]]]]:
         """
-        Get book recommendations and format for Gradio gallery.
+        Get book recommendations for a batch of requests and format for Gradio gallery.
+
+        Gradio groups up to ``config.app.max_batch_size`` queued clicks into one
+        call, so their queries are embedded and searched together.
 
         Args:
-            query: User's search query
-            category: Selected category
-            tone: Selected tone
+            queries: User search queries
+            categories: Selected categories
+            tones: Selected tones
 
         Returns:
-            List of (image_url, caption) tuples for Gradio gallery.
+            One-element list (for the single gallery output) holding a list of
+            (image_url, caption) tuples per request.
         """
+        import gradio as gr
+
+        galleries: List[List[Tuple[str, str]]] = [[] for _ in queries]
         try:
-            if not query.strip():
-                return []
-
-            # Create recommendation request
-            request = RecommendationRequest(
-                query=query,
-                category=category,
-                tone=tone,
-                top_k=config.search.final_top_k
+            # Create recommendation requests, skipping empty queries
+            indices = [i for i, query in enumerate(queries) if query.strip()]
+            if not indices:
+                return [galleries]
+
+            requests = [
+                RecommendationRequest(
+                    query=queries[i],
+                    category=categories[i],
+                    tone=tones[i],
+                    top_k=config.search.final_top_k
+                )
+                for i in indices
+            ]
+
+            # Get recommendations off the event loop
+            loop = asyncio.get_running_loop()
+            responses = await loop.run_in_executor(
+                None, self.recommender.recommend_batch, requests
             )
 
-            # Get recommendations
-            response = self.recommender.recommend(request)
-
-            # Format for Gradio gallery
-            results = []
-            for rec in response.recommendations:
-                results.append((rec.thumbnail_url, rec.caption))
-
-            logger.info(
-                f"Generated {len(results)} recommendations for query: '{query}'")
-            return results
+            # Format for Gradio gallery; failed requests keep an empty gallery
+            for i, response in zip(indices, responses):
+                if isinstance(response, RecommendationError):
+                    gr.Warning(f"Recommendation failed: {response}")
+                    continue
+                galleries[i] = [
+                    (rec.thumbnail_url, rec.caption) for rec in response.recommendations
+                ]
+                logger.info(
+                    "Generated {} recommendations for query: '{}'",
+                    len(galleries[i]),
+                    queries[i]
+                )
+            return [galleries]
 
         except RecommendationError as e:
-            logger.error(f"Recommendation error: {e}")
-            gr.Warning(f"Recommendation failed: {str(e)}")
-            return []
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}")
+            logger.error("Recommendation error: {}", e)
+            gr.Warning(f"Recommendation failed: {e}")
+            return [galleries]
+        except Exception:
+            logger.exception("Unexpected error")
             gr.Warning("An unexpected error occurred. Please try again.")
-            return []
-
-    def _show_loading(self) -> gr.update:
-        """Show loading message."""
-        return gr.update(value="⏳ Loading recommendations...", visible=True)
-
-    def _hide_loading(self) -> gr.update:
-        """Hide loading message."""
-        return gr.update(value="", visible=False)
-
-    def _get_custom_css(self) -> str:
-        """Get custom CSS for the interface."""
-        return """
-        .header {
-            margin-bottom: 2rem;
-        }
-        
-        .input-textbox {
-            border-radius: 8px;
-        }
-        
-        .dropdown {
-            border-radius: 8px;
-        }
-        
-        .submit-button {
-            margin: 1rem 0;
-            border-radius: 8px;
-            font-weight: bold;
-        }
-        
-        .loading-text {
-            text-align: center;
-            color: #007bff;
-            font-weight: bold;
-        }
-        
-        .gallery {
-            margin-top: 1rem;
-            border-radius: 8px;
-        }
-        
-        .footer {
-            margin-top: 2rem;
-            font-size: 0.9em;
-        }
-        
-        #recommendations-gallery .thumbnail {
-            border-radius: 8px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }
-        """
+            return [galleries]
 
     def launch(
         self,
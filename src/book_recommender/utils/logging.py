@@ -1,34 +1,52 @@
 """Logging utilities for the Book Recommender System."""
 
 import sys
+import threading
 from pathlib import Path
 from loguru import logger
 
 from ..core.config import config
 
+# Handlers are installed once per process
+_initialized = False
+_lock = threading.Lock()
+
 
 def setup_logging() -> None:
-    """Setup logging configuration."""
-    # Remove default handler
-    logger.remove()
-
-    # Create logs directory if it doesn't exist
-    log_file = Path(config.logging.file)
-    log_file.parent.mkdir(parents=True, exist_ok=True)
-
-    # Add console handler
-    logger.add(
-        sys.stderr,
-        format=config.logging.format,
-        level=config.logging.level,
-        colorize=True,
-    )
-
-    # Add file handler
-    logger.add(
-        str(log_file),
-        format=config.logging.format,
-        level=config.logging.level,
-        rotation="10 MB",
-        retention="1 week",
-    )
+    """Setup logging configuration. Calls after the first one do nothing."""
+    global _initialized
+
+    with _lock:
+        if _initialized:
+            return
+
+        # Remove default handler
+        logger.remove()
+
+        # Create logs directory if it doesn't exist
+        log_file = Path(config.logging.file)
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+
+        # Add console handler
+        logger.add(
+            sys.stderr,
+            format=config.logging.format,
+            level=config.logging.level,
+            colorize=True,
+        )
+
+        # Add file handler; records are written from a background queue so
+        # request handlers never block on disk I/O
+        logger.add(
+            str(log_file),
+            format=config.logging.format,
+            level=config.logging.level,
+            rotation="10 MB",
+            retention="1 week",
+            compression="zip",
+            enqueue=True,
+            backtrace=False,
+            diagnose=False,
+        )
+
+        _initialized = True
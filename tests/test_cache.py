@@ -0,0 +1,73 @@
+"""Test response caching for the Book Recommender System."""
+
+import numpy as np
+
+from book_recommender.core.cache import ResponseCache
+
+
+class TestResponseCache:
+    """Test ResponseCache lookups and eviction."""
+
+    def test_exact_hit_normalizes_query(self):
+        """Test that case and whitespace differences still hit."""
+        cache = ResponseCache(max_size=4)
+        cache.put(("All", "All", 12), "A dark  Mystery ", "response")
+
+        assert cache.get(("All", "All", 12), "a dark mystery") == "response"
+        assert cache.get(("Fiction", "All", 12), "a dark mystery") is None
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = ResponseCache(max_size=2)
+        cache.put("scope", "first", 1)
+        cache.put("scope", "second", 2)
+        cache.get("scope", "first")
+        cache.put("scope", "third", 3)
+
+        assert len(cache) == 2
+        assert cache.get("scope", "first") == 1
+        assert cache.get("scope", "second") is None
+
+    def test_expired_entry_is_a_miss(self):
+        """Test that entries older than the TTL are not returned."""
+        cache = ResponseCache(max_size=2, ttl_seconds=0.0)
+        cache.put("scope", "query", "response")
+
+        assert cache.get("scope", "query") is None
+
+    def test_similar_query_hit(self):
+        """Test similarity lookup against cached query embeddings."""
+        cache = ResponseCache(max_size=4, similarity_threshold=0.97)
+        cache.put("scope", "space opera", "response", embedding=[1.0, 0.0])
+
+        near = np.array([0.99, 0.1]) / np.linalg.norm([0.99, 0.1])
+        assert cache.get_similar("scope", near) == "response"
+        assert cache.get_similar("scope", [0.0, 1.0]) is None
+        assert cache.get_similar("other", near) is None
+
+    def test_disabled_cache(self):
+        """Test that a zero-size cache stores nothing."""
+        cache = ResponseCache(max_size=0, similarity_threshold=0.97)
+        cache.put("scope", "query", "response", embedding=[1.0, 0.0])
+
+        assert cache.get("scope", "query") is None
+        assert cache.get_similar("scope", [1.0, 0.0]) is None
+
+    def test_similar_lookup_tracks_eviction(self):
+        """Test that evicted entries no longer match similar queries."""
+        cache = ResponseCache(max_size=20, similarity_threshold=0.97)
+        embeddings = np.eye(24, dtype=np.float32)
+        for i, embedding in enumerate(embeddings):
+            cache.put("scope", f"query {i}", i, embedding=embedding)
+
+        assert len(cache) == 20
+        assert cache.get_similar("scope", embeddings[0]) is None
+        assert cache.get_similar("scope", embeddings[23]) == 23
+
+    def test_similar_lookup_skips_expired_entries(self):
+        """Test that an expired best match is not returned."""
+        cache = ResponseCache(max_size=4, ttl_seconds=0.0, similarity_threshold=0.97)
+        cache.put("scope", "query", "response", embedding=[1.0, 0.0])
+
+        assert cache.get_similar("scope", [1.0, 0.0]) is None
+        assert len(cache) == 0
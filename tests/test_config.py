@@ -1,8 +1,6 @@
 """Test configuration for the Book Recommender System."""
 
-import pytest
-import tempfile
-from pathlib import Path
+import os
 
 from book_recommender.core.config import Config, load_config
 
@@ -26,29 +24,37 @@ class TestConfig:
         assert isinstance(config, Config)
         assert config.app.name == "Book Recommender System"
 
-    def test_load_config_from_file(self):
+    def test_load_config_from_file(self, tmp_path):
         """Test loading config from YAML file."""
-        # Create temporary config file
-        config_data = """
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("""
 app:
   name: "Test App"
   port: 8080
 search:
   final_top_k: 20
-"""
+""")
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(config_data)
-            temp_path = f.name
+        config = load_config(str(config_path))
 
-        try:
-            config = load_config(temp_path)
-
-            assert config.app.name == "Test App"
-            assert config.app.port == 8080
-            assert config.search.final_top_k == 20
-            # Verify defaults are preserved
-            assert config.model.embedding_model == "all-MiniLM-L6-v2"
+        assert config.app.name == "Test App"
+        assert config.app.port == 8080
+        assert config.search.final_top_k == 20
+        # Verify defaults are preserved
+        assert config.model.embedding_model == "all-MiniLM-L6-v2"
 
-        finally:
-            Path(temp_path).unlink()  # Clean up
+    def test_load_config_rereads_modified_file(self, tmp_path):
+        """Test that cached config content is refreshed when the file changes."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("app:\n  port: 8080\n")
+        first = load_config(str(config_path))
+        second = load_config(str(config_path))
+
+        config_path.write_text("app:\n  port: 9090\n")
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        third = load_config(str(config_path))
+
+        assert first.app.port == second.app.port == 8080
+        assert first is not second  # Each call gets its own Config
+        assert third.app.port == 9090
@@ -11,38 +11,47 @@ from book_recommender.core.models import (
 )
 
 
+@pytest.fixture(scope="module")
+def book_factory():
+    """Build Books from a shared set of required fields."""
+    defaults = {
+        "isbn13": 9780123456789,
+        "title": "Test Book",
+        "authors": "Test Author",
+        "description": "A test book description",
+        "simplified_categories": "Fiction"
+    }
+
+    def make_book(**overrides):
+        return Book(**{**defaults, **overrides})
+
+    return make_book
+
+
 class TestBook:
     """Test Book model."""
 
-    def test_book_creation(self):
-        """Test creating a valid book."""
-        book = Book(
-            isbn13=9780123456789,
-            title="Test Book",
-            authors="Test Author",
-            description="A test book description",
-            simplified_categories="Fiction"
-        )
-
-        assert book.isbn13 == 9780123456789
-        assert book.title == "Test Book"
-        assert book.authors == "Test Author"
-        assert book.joy == 0.0  # Default value
-
-    def test_book_with_emotions(self):
-        """Test book with emotion scores."""
-        book = Book(
-            isbn13=9780123456789,
-            title="Happy Book",
-            authors="Joy Author",
-            description="A very happy book",
-            simplified_categories="Fiction",
-            joy=0.9,
-            sad=0.1
-        )
+    @pytest.mark.parametrize("kwargs,expected", [
+        (
+            {},
+            {
+                "isbn13": 9780123456789,
+                "title": "Test Book",
+                "authors": "Test Author",
+                "joy": 0.0  # Default value
+            }
+        ),
+        (
+            {"title": "Happy Book", "joy": 0.9, "sad": 0.1},
+            {"title": "Happy Book", "joy": 0.9, "sad": 0.1}
+        ),
+    ], ids=["defaults", "emotions"])
+    def test_book_creation(self, book_factory, kwargs, expected):
+        """Test creating a valid book, with and without emotion scores."""
+        book = book_factory(**kwargs)
 
-        assert book.joy == 0.9
-        assert book.sad == 0.1
+        for field, value in expected.items():
+            assert getattr(book, field) == value
 
 
 class TestRecommendationRequest:
@@ -0,0 +1,264 @@
+"""Test the recommendation engine for the Book Recommender System."""
+
+from typing import List
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from book_recommender.core.config import config
+from book_recommender.core.models import RecommendationRequest, RecommendationResponse
+from book_recommender.core import recommender as recommender_module
+from book_recommender.core.recommender import BookRecommender, get_recommender
+from book_recommender.utils.exceptions import RecommendationError
+
+
+class FakeEmbeddings:
+    """Embeddings stand-in that maps each query to a fixed unit vector."""
+
+    def __init__(self, vectors: dict):
+        self.vectors = vectors
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.vectors[text]
+
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        return [self.vectors[text] for text in texts]
+
+
+# Tiny catalog: an unused column, one missing thumbnail, one missing author,
+# and only two of the mapped emotion columns (joy, fear)
+CATALOG_CSV = """\
+isbn13,title,authors,description,thumbnail,published_year,simplified_categories,joy,fear
+101,One,Ann,First,http://covers/101?id=1,2001,Fiction,0.1,0.9
+102,Two,Ann;Bob,Second,http://covers/102?id=2,2002,Nonfiction,0.7,0.2
+103,Three,Ann;Bob;Cy,Third,,2003,Fiction,0.4,0.4
+104,Four,Dee,Fourth,http://covers/104?id=4,2004,Fiction,0.7,0.0
+105,Five,,Fifth,http://covers/105?id=5,2005,Fiction,0.9,0.1
+"""
+
+
+@pytest.fixture
+def recommender(tmp_path):
+    """Build a recommender over a tiny catalog loaded by _load_data."""
+    books_file = tmp_path / config.data.books_file
+    books_file.parent.mkdir(parents=True, exist_ok=True)
+    books_file.write_text(CATALOG_CSV)
+
+    recommender = BookRecommender(data_dir=tmp_path)
+    recommender._load_data()
+    recommender._is_initialized = True
+    return recommender
+
+
+class TestLoadData:
+    """Test loading the books catalog."""
+
+    def test_columns_and_dtypes(self, recommender):
+        """Test that only used columns are kept, with compact dtypes."""
+        books = recommender.books_df
+
+        assert list(books.columns) == [
+            "isbn13", "title", "authors", "description", "simplified_categories",
+            "joy", "fear", "large_thumbnail"
+        ]
+        assert books["isbn13"].tolist() == [101, 102, 103, 104, 105]
+        assert books["isbn13"].dtype == np.int64
+        assert books["joy"].dtype == np.float32
+        assert books["title"].dtype == pd.ArrowDtype(pa.string())
+        assert books["simplified_categories"].dtype == "category"
+        assert pd.isna(books["authors"].iloc[4])
+
+    def test_lookup_structures(self, recommender):
+        """Test the ISBN, category, emotion and tone lookups."""
+        assert recommender._isbn_to_row == {101: 0, 102: 1, 103: 2, 104: 3, 105: 4}
+        assert recommender._category_to_code == {"Fiction": 0, "Nonfiction": 1}
+        assert recommender._category_codes.tolist() == [0, 1, 0, 0, 0]
+        assert recommender._emotions.dtype == np.float32
+        np.testing.assert_allclose(recommender._emotions, [
+            [0.1, 0.9],
+            [0.7, 0.2],
+            [0.4, 0.4],
+            [0.7, 0.0],
+            [0.9, 0.1],
+        ], rtol=1e-6)
+        # Tones whose emotion column is missing from the CSV are skipped
+        assert recommender._tone_to_emotion_index == {"Happy": 0, "Suspensful": 1}
+
+    def test_thumbnails(self, recommender, tmp_path):
+        """Test large thumbnail URLs and the missing-cover fallback."""
+        assert recommender.books_df["large_thumbnail"].tolist() == [
+            "http://covers/101?id=1&fife=w800",
+            "http://covers/102?id=2&fife=w800",
+            str(tmp_path / config.data.missing_cover_image),
+            "http://covers/104?id=4&fife=w800",
+            "http://covers/105?id=5&fife=w800",
+        ]
+
+
+class TestRecommendBatch:
+    """Test batched recommendations."""
+
+    def test_failed_request_does_not_fail_batch(self, recommender, monkeypatch):
+        """Test that one unbuildable response leaves the rest of the batch intact."""
+        recommender.embedding_model = FakeEmbeddings({
+            "bad": [1.0, 0.0],
+            "good": [0.0, 1.0],
+        })
+        # "bad" matches the book with no authors, which fails Book validation
+        monkeypatch.setattr(
+            recommender,
+            "_query_documents",
+            lambda embeddings, n_results: [["105 Fifth"], ["101 First"]]
+        )
+
+        responses = recommender.recommend_batch([
+            RecommendationRequest(query="bad"),
+            RecommendationRequest(query="good"),
+        ])
+
+        assert isinstance(responses[0], RecommendationError)
+        assert isinstance(responses[1], RecommendationResponse)
+        assert [r.book.isbn13 for r in responses[1].recommendations] == [101]
+
+
+class TestCreateCaptions:
+    """Test caption formatting."""
+
+    @pytest.mark.parametrize(
+        "dtype", [object, pd.ArrowDtype(pa.string())], ids=["object", "arrow"]
+    )
+    def test_captions(self, dtype):
+        """Test author joining and description truncation."""
+        max_length = config.ui.description_truncate_length
+        books = pd.DataFrame({
+            "title": ["One", "Two", "Three", "Four"],
+            "authors": ["Ann", "Ann;Bob", "Ann;Bob;Cy;Dee", "Ann"],
+            "description": [
+                "x" * max_length,
+                "y" * (max_length + 1),
+                "Short",
+                None,
+            ],
+        }, dtype=dtype)
+
+        captions = BookRecommender()._create_captions(books)
+
+        assert captions.tolist() == [
+            "One by Ann\n\n" + "x" * max_length,
+            "Two by Ann and Bob\n\n" + "y" * max_length + "...",
+            "Three by Ann, Bob, Cy and Dee\n\nShort",
+            "Four by Ann\n\n",
+        ]
+
+
+class TestFilterBooks:
+    """Test ranking and filtering of semantic matches."""
+
+    @staticmethod
+    def isbns(books: pd.DataFrame) -> List[int]:
+        return books["isbn13"].tolist()
+
+    def test_keeps_rank_order_without_tone(self, recommender):
+        """Test that matches keep their similarity order and unknown ISBNs drop."""
+        books = recommender._filter_books([103, 999, 101, 105], final_top_k=12)
+
+        assert self.isbns(books) == [103, 101, 105]
+
+    def test_truncates_to_initial_and_final_top_k(self, recommender):
+        """Test that only the first initial_top_k matches are considered."""
+        book_ids = [101, 102, 103, 104, 105]
+
+        assert self.isbns(recommender._filter_books(
+            book_ids, initial_top_k=2, final_top_k=12
+        )) == [101, 102]
+        assert self.isbns(recommender._filter_books(
+            book_ids, final_top_k=3
+        )) == [101, 102, 103]
+
+    def test_category_filter(self, recommender):
+        """Test category filtering, including an unknown category."""
+        book_ids = [102, 103, 101]
+
+        assert self.isbns(recommender._filter_books(
+            book_ids, category="Fiction"
+        )) == [103, 101]
+        assert self.isbns(recommender._filter_books(
+            book_ids, category="Poetry"
+        )) == []
+
+    @pytest.mark.parametrize("final_top_k", [1, 2, 3, 5, 10])
+    @pytest.mark.parametrize("tone", ["Happy", "Suspensful"])
+    def test_tone_matches_full_sort(self, recommender, tone, final_top_k):
+        """Test that partial top-k selection matches a full stable sort."""
+        book_ids = [103, 101, 105, 102, 104]
+        rows = [recommender._isbn_to_row[isbn] for isbn in book_ids]
+        scores = recommender._emotions[rows, recommender._tone_to_emotion_index[tone]]
+        expected = [
+            book_ids[i] for i in np.argsort(-scores, kind="stable")[:final_top_k]
+        ]
+
+        books = recommender._filter_books(book_ids, tone=tone, final_top_k=final_top_k)
+
+        assert self.isbns(books) == expected
+
+    def test_tone_ties_keep_rank_order(self, recommender):
+        """Test that books with equal tone scores stay in similarity order."""
+        rng = np.random.default_rng(0)
+        recommender.books_df = pd.DataFrame({"isbn13": np.arange(50)})
+        recommender._isbn_to_row = {isbn: isbn for isbn in range(50)}
+
+        for _ in range(100):
+            # Few distinct scores, so most candidates tie with another
+            recommender._emotions = rng.integers(0, 4, (50, 2)).astype(np.float32)
+            book_ids = rng.permutation(50).tolist()
+            scores = recommender._emotions[book_ids, 0]
+            expected = [book_ids[i] for i in np.argsort(-scores, kind="stable")[:12]]
+
+            books = recommender._filter_books(book_ids, tone="Happy", final_top_k=12)
+
+            assert self.isbns(books) == expected
+
+    @pytest.mark.parametrize("tone", ["All", "Happy"])
+    def test_empty_matches(self, recommender, tone):
+        """Test that no matches give an empty result for any tone."""
+        assert self.isbns(recommender._filter_books([], tone=tone)) == []
+        assert self.isbns(recommender._filter_books(
+            [101, 102], category="Poetry", tone=tone
+        )) == []
+
+
+class TestWarmup:
+    """Test recommender warmup."""
+
+    def test_warmup_does_not_cache(self, recommender, monkeypatch):
+        """Test that warmup queries the index without storing a response."""
+        recommender.embedding_model = FakeEmbeddings({"warmup": [1.0, 0.0]})
+        queried = []
+        monkeypatch.setattr(
+            recommender,
+            "_query_documents",
+            lambda embeddings, n_results: queried.append(embeddings) or [[]]
+        )
+
+        recommender.warmup()
+
+        assert queried == [[[1.0, 0.0]]]
+        assert len(recommender._response_cache) == 0
+
+
+class TestGetRecommender:
+    """Test the shared recommender accessor."""
+
+    def test_shared_per_data_dir(self, tmp_path, monkeypatch):
+        """Test that each data directory gets one shared recommender."""
+        monkeypatch.setattr(recommender_module, "_recommenders", {})
+        monkeypatch.setattr(BookRecommender, "initialize", lambda self: None)
+        (tmp_path / "other").mkdir()
+
+        first = get_recommender(tmp_path)
+
+        assert get_recommender(tmp_path / "other" / "..") is first
+        assert get_recommender(tmp_path / "other") is not first
+        assert get_recommender(tmp_path / "other").data_dir == tmp_path / "other"